@@ -11,6 +11,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from .models import UserProfile
 from .rbac import get_permissions_for_user, get_user_roles
 
 User = get_user_model()
@@ -21,12 +22,14 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         data = super().validate(attrs)
+        roles = get_user_roles(self.user)
+        permissions_map = get_permissions_for_user(self.user)
         data["user"] = {
             "id": self.user.pk,
             "email": self.user.email,
             "username": self.user.get_username(),
-            "roles": get_user_roles(self.user),
-            "permissions": get_permissions_for_user(self.user),
+            "roles": roles,
+            "permissions": permissions_map,
         }
         return data
 
@@ -46,20 +49,22 @@ class MeAPIView(APIView):
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         user = request.user
-        profile = getattr(user, "profile", None)
+        profile = (
+            UserProfile.objects.filter(user_id=user.pk)
+            .values("phone", "date_of_birth", "mfa_enabled")
+            .first()
+        )
+        roles = get_user_roles(user)
+        permissions_map = get_permissions_for_user(user)
         data = {
             "id": user.pk,
             "email": user.email,
             "username": user.get_username(),
-            "roles": get_user_roles(user),
-            "permissions": get_permissions_for_user(user),
+            "roles": roles,
+            "permissions": permissions_map,
         }
         if profile:
-            data["profile"] = {
-                "phone": profile.phone,
-                "date_of_birth": profile.date_of_birth,
-                "mfa_enabled": profile.mfa_enabled,
-            }
+            data["profile"] = profile
         return Response(data)
 
 
@@ -0,0 +1,83 @@
+"""Read-only serializer variants for hot list endpoints."""
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+from .serializers import NotificationSerializer, ObservationSerializer, PatientSerializer
+
+# (output name, attribute getter, converter, whether the getter is DRF's ``get_attribute``)
+_PlanEntry = Tuple[str, Callable[[Any], Any], Callable[[Any], Any], bool]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class FastRepresentationMixin:
+    """Render rows through a plan of plain attribute getters built once per serializer.
+
+    Concrete, non-relational model fields and primary-key relations are read
+    straight from the instance; anything else (nested serializers, methods)
+    goes through DRF's regular ``get_attribute``/``to_representation`` pair.
+    The output matches the wrapped serializer but is a plain ``dict``.
+    """
+
+    def _representation_plan(self) -> List[_PlanEntry]:
+        plan = self.__dict__.get("_plan")
+        if plan is None:
+            plan = [self._plan_entry(field) for field in self._readable_fields]
+            self.__dict__["_plan"] = plan
+        return plan
+
+    def _plan_entry(self, field: serializers.Field) -> _PlanEntry:
+        if len(field.source_attrs) == 1:
+            try:
+                model_field = self.Meta.model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                model_field = None
+            if model_field is not None and model_field.concrete:
+                if not model_field.is_relation and not isinstance(field, serializers.RelatedField):
+                    return field.field_name, attrgetter(model_field.attname), field.to_representation, False
+                if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+                    return field.field_name, attrgetter(model_field.attname), _identity, False
+        return field.field_name, field.get_attribute, field.to_representation, True
+
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        ret: Dict[str, Any] = {}
+        for name, getter, convert, generic in self._representation_plan():
+            if generic:
+                try:
+                    value = getter(instance)
+                except SkipField:
+                    continue
+                check = value.pk if isinstance(value, PKOnlyObject) else value
+            else:
+                value = check = getter(instance)
+            ret[name] = None if check is None else convert(value)
+        return ret
+
+
+class FastPatientSerializer(FastRepresentationMixin, PatientSerializer):
+    pass
+
+
+class FastObservationSerializer(FastRepresentationMixin, ObservationSerializer):
+    pass
+
+
+class FastNotificationSerializer(FastRepresentationMixin, NotificationSerializer):
+    pass
+
+
+__all__ = [
+    "FastNotificationSerializer",
+    "FastObservationSerializer",
+    "FastPatientSerializer",
+    "FastRepresentationMixin",
+]
@@ -1,6 +1,13 @@
-"""Filter classes for API endpoints."""
+"""Filter classes for API endpoints.
+
+Identifier filters (resource ids, MRNs, recipient ids) use exact matching, as
+FHIR token search does, so they are served by the plain column indexes.
+"""
 from __future__ import annotations
 
+import operator
+from functools import reduce
+
 import django_filters
 from django.db import models
 
@@ -15,7 +22,7 @@ from .models import (
 
 
 class PatientFilter(django_filters.FilterSet):
-    identifier = django_filters.CharFilter(field_name="primary_identifier", lookup_expr="iexact")
+    identifier = django_filters.CharFilter(field_name="primary_identifier")
     name = django_filters.CharFilter(method="filter_by_name")
     birthdate = django_filters.DateFilter(field_name="birth_date")
     phone = django_filters.CharFilter(field_name="phone", lookup_expr="icontains")
@@ -27,17 +34,22 @@ class PatientFilter(django_filters.FilterSet):
 
     def filter_by_name(self, queryset, name, value):
         tokens = value.split()
-        for token in tokens:
-            queryset = queryset.filter(
+        if not tokens:
+            return queryset
+        condition = reduce(
+            operator.and_,
+            (
                 models.Q(first_name__icontains=token)
                 | models.Q(last_name__icontains=token)
                 | models.Q(middle_name__icontains=token)
-            )
-        return queryset
+                for token in tokens
+            ),
+        )
+        return queryset.filter(condition)
 
 
 class ObservationFilter(django_filters.FilterSet):
-    patient = django_filters.CharFilter(field_name="patient__resource_id", lookup_expr="iexact")
+    patient = django_filters.CharFilter(field_name="patient__resource_id")
     code = django_filters.CharFilter(field_name="code", lookup_expr="iexact")
     category = django_filters.CharFilter(field_name="category", lookup_expr="iexact")
     start = django_filters.DateTimeFilter(field_name="effective_time", lookup_expr="gte")
@@ -50,7 +62,7 @@ class ObservationFilter(django_filters.FilterSet):
 
 class AppointmentFilter(django_filters.FilterSet):
     practitioner = django_filters.CharFilter(field_name="practitioner_reference", lookup_expr="iexact")
-    patient = django_filters.CharFilter(field_name="patient__resource_id", lookup_expr="iexact")
+    patient = django_filters.CharFilter(field_name="patient__resource_id")
     status = django_filters.CharFilter(field_name="status", lookup_expr="iexact")
     date = django_filters.DateFilter(field_name="start__date")
 
@@ -69,7 +81,7 @@ class HL7MessageFilter(django_filters.FilterSet):
 
 
 class NotificationFilter(django_filters.FilterSet):
-    recipient = django_filters.CharFilter(field_name="recipient_id", lookup_expr="iexact")
+    recipient = django_filters.CharFilter(field_name="recipient_id")
     status = django_filters.CharFilter(field_name="status", lookup_expr="iexact")
 
     class Meta:
@@ -78,7 +90,7 @@ class NotificationFilter(django_filters.FilterSet):
 
 
 class RiskScoreFilter(django_filters.FilterSet):
-    patient = django_filters.CharFilter(field_name="patient__resource_id", lookup_expr="iexact")
+    patient = django_filters.CharFilter(field_name="patient__resource_id")
     risk_type = django_filters.CharFilter(field_name="risk_type", lookup_expr="iexact")
 
     class Meta:
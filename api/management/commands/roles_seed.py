@@ -3,9 +3,11 @@ from __future__ import annotations
 
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
+from django.db import connection
 
+from ... import rbac_cache
 from ...models import Role
-from ...rbac import ROLE_PERMISSIONS
+from ...rbac import ROLE_PERMISSIONS, invalidate_all_user_roles
 
 User = get_user_model()
 
@@ -18,12 +20,10 @@ class Command(BaseCommand):
         parser.add_argument("--admin-password", dest="admin_password", help="Password for the bootstrap admin user")
 
     def handle(self, *args, **options):
-        for role_name, permissions in ROLE_PERMISSIONS.items():
-            role, created = Role.objects.get_or_create(name=role_name)
-            if created:
-                self.stdout.write(self.style.SUCCESS(f"Created role {role_name}"))
-            role.permissions = permissions
-            role.save()
+        if connection.features.supports_update_conflicts:
+            self._upsert_roles()
+        else:
+            self._save_roles()
 
         admin_email = options.get("admin_email") or "admin@example.com"
         admin_password = options.get("admin_password") or "ChangeMe123!"
@@ -39,3 +39,30 @@ class Command(BaseCommand):
             self.stdout.write("Admin user already exists; skipping creation.")
 
         self.stdout.write(self.style.SUCCESS("Role seeding completed."))
+
+    def _upsert_roles(self) -> None:
+        """Insert or refresh every default role in a single statement."""
+        existing = set(Role.objects.filter(name__in=ROLE_PERMISSIONS).values_list("name", flat=True))
+        roles = [Role(name=name, permissions=permissions) for name, permissions in ROLE_PERMISSIONS.items()]
+        # MySQL resolves conflicts against any unique key and rejects explicit targets.
+        unique_fields = ["name"] if connection.features.supports_update_conflicts_with_target else None
+        Role.objects.bulk_create(
+            roles,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=["permissions", "updated_at"],
+        )
+        # bulk_create does not send post_save, so drop cached RBAC data explicitly.
+        invalidate_all_user_roles()
+        rbac_cache.clear()
+        for name in ROLE_PERMISSIONS:
+            if name not in existing:
+                self.stdout.write(self.style.SUCCESS(f"Created role {name}"))
+
+    def _save_roles(self) -> None:
+        for role_name, permissions in ROLE_PERMISSIONS.items():
+            role, created = Role.objects.get_or_create(name=role_name)
+            if created:
+                self.stdout.write(self.style.SUCCESS(f"Created role {role_name}"))
+            role.permissions = permissions
+            role.save()
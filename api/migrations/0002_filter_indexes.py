@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-15 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['patient', 'start'], name='api_appoint_patient_4111e8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['status', 'start'], name='api_appoint_status_58656c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient_id', 'status'], name='api_notific_recipie_6f44c7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='observation',
+            index=models.Index(fields=['patient', 'code', '-effective_time'], name='api_observa_patient_0cd609_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='riskscore',
+            index=models.Index(fields=['patient', 'risk_type', '-calculated_at'], name='api_risksco_patient_8dd6f8_idx'),
+        ),
+    ]
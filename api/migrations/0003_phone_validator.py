@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-15 18:13
+
+import api.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='patient',
+            name='phone',
+            field=models.CharField(blank=True, max_length=32, validators=[api.models._validate_phone]),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='phone',
+            field=models.CharField(blank=True, max_length=32, validators=[api.models._validate_phone]),
+        ),
+    ]
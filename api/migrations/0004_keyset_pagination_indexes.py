@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-15 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_phone_validator'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditevent',
+            index=models.Index(fields=['-created_at'], name='api_auditev_created_291531_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fhiraccesslog',
+            index=models.Index(fields=['-created_at'], name='api_fhiracc_created_6a1a32_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hl7message',
+            index=models.Index(fields=['-created_at'], name='api_hl7mess_created_26076b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='observation',
+            index=models.Index(fields=['-effective_time'], name='api_observa_effecti_4af145_idx'),
+        ),
+    ]
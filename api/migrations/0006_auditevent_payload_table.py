@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-15 18:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_metadata_to_payload(apps, schema_editor):
+    AuditEvent = apps.get_model("api", "AuditEvent")
+    AuditEventPayload = apps.get_model("api", "AuditEventPayload")
+    events = AuditEvent.objects.only("id", "metadata").iterator(chunk_size=500)
+    batch = []
+    for event in events:
+        batch.append(AuditEventPayload(event_id=event.pk, metadata=event.metadata or {}))
+        if len(batch) >= 500:
+            AuditEventPayload.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        AuditEventPayload.objects.bulk_create(batch)
+
+
+def copy_payload_to_metadata(apps, schema_editor):
+    AuditEvent = apps.get_model("api", "AuditEvent")
+    AuditEventPayload = apps.get_model("api", "AuditEventPayload")
+    for payload in AuditEventPayload.objects.iterator(chunk_size=500):
+        AuditEvent.objects.filter(pk=payload.event_id).update(metadata=payload.metadata)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_drop_redundant_fk_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditEventPayload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('metadata', models.JSONField(default=dict)),
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='payload', to='api.auditevent')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(copy_metadata_to_payload, copy_payload_to_metadata),
+        migrations.RemoveField(
+            model_name='auditevent',
+            name='metadata',
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+# auth.User is not ours to add Meta indexes to, so the index is managed here.
+EMAIL_LOWER_INDEX = models.Index(Lower("email"), name="auth_user_email_lower_idx")
+
+
+def create_email_index(apps, schema_editor):
+    if not schema_editor.connection.features.supports_expression_indexes:
+        return
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.add_index(User, EMAIL_LOWER_INDEX)
+
+
+def drop_email_index(apps, schema_editor):
+    if not schema_editor.connection.features.supports_expression_indexes:
+        return
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.remove_index(User, EMAIL_LOWER_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('api', '0006_auditevent_payload_table'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_email_index, drop_email_index),
+    ]
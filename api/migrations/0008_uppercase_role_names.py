@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def uppercase_role_names(apps, schema_editor):
+    Role = apps.get_model("api", "Role")
+    taken = set(Role.objects.values_list("name", flat=True))
+    for role in Role.objects.only("id", "name"):
+        upper = role.name.upper()
+        # Leave case-only duplicates alone; they need a manual merge of their assignments.
+        if upper != role.name and upper not in taken:
+            Role.objects.filter(pk=role.pk).update(name=upper)
+            taken.add(upper)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_user_email_lower_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(uppercase_role_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 18:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_uppercase_role_names'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userrole',
+            index=models.Index(fields=['user', 'expiry_date', 'effective_date'], name='api_userrol_user_id_6ea832_idx'),
+        ),
+    ]
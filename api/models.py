@@ -1,18 +1,42 @@
 """Database models for the FHIR Patient Portal."""
 from __future__ import annotations
 
+import re
+
 from django.contrib.auth import get_user_model
-from django.core.validators import MinValueValidator, RegexValidator
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils import timezone
 
 User = get_user_model()
 
-PHONE_VALIDATOR = RegexValidator(r"^[0-9+\-()\s]{7,20}$", "Enter a valid phone number.")
+_PHONE_RE = re.compile(r"^[0-9+\-()\s]{7,20}$")
+
+
+def _validate_phone(value: str) -> None:
+    """Reject values that do not look like a phone number."""
+    if not _PHONE_RE.match(str(value)):
+        raise ValidationError("Enter a valid phone number.", code="invalid")
+
+
+PHONE_VALIDATOR = _validate_phone
 
 
 class TimeStampedModel(models.Model):
-    """Abstract base class for created/updated timestamps."""
+    """Abstract base class for created/updated timestamps.
+
+    Models with bulky payload columns declare them in ``LIST_DEFER``. Scans and
+    exports that only need the thin columns should stream with
+    ``Model.objects.defer(*Model.LIST_DEFER).iterator(chunk_size=500)``.
+
+    ``DEFAULT_SELECT_RELATED`` names the foreign keys API views dereference per
+    row (e.g. for object-level RBAC checks); viewsets join them up front and
+    defer the joined model's ``LIST_DEFER`` columns.
+    """
+
+    LIST_DEFER: tuple = ()
+    DEFAULT_SELECT_RELATED: tuple = ()
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -34,6 +58,11 @@ class Role(TimeStampedModel):
     def __str__(self) -> str:  # pragma: no cover - human readable
         return self.name
 
+    def save(self, *args, **kwargs) -> None:
+        # Names are stored upper-case so lookups can use plain equality on the unique index.
+        self.name = self.name.upper()
+        super().save(*args, **kwargs)
+
 
 class UserProfile(TimeStampedModel):
     """Additional metadata tracked for each user."""
@@ -51,7 +80,10 @@ class UserProfile(TimeStampedModel):
 class UserRole(TimeStampedModel):
     """Assignment of a role to a user with effective windows."""
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="role_assignments")
+    # Indexed through the leading column of the unique (user, role, effective_date) key.
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="role_assignments", db_index=False
+    )
     role = models.ForeignKey(Role, on_delete=models.CASCADE, related_name="role_assignments")
     assigned_by = models.ForeignKey(
         User,
@@ -67,6 +99,8 @@ class UserRole(TimeStampedModel):
     class Meta:
         unique_together = ("user", "role", "effective_date")
         ordering = ["-effective_date"]
+        # Serves the active-assignment lookup: user equality, then the expiry_date range.
+        indexes = [models.Index(fields=["user", "expiry_date", "effective_date"])]
 
     @property
     def is_active(self) -> bool:
@@ -113,8 +147,11 @@ class HL7Message(TimeStampedModel):
         related_name="messages",
     )
 
+    LIST_DEFER = ("raw_message", "parsed_payload", "errors")
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["-created_at"])]
 
 
 class Patient(TimeStampedModel):
@@ -148,12 +185,14 @@ class Patient(TimeStampedModel):
     )
     organization_id = models.CharField(max_length=64, blank=True)
 
+    LIST_DEFER = ("identifiers", "address", "telecom")
+
     class Meta:
         ordering = ["last_name", "first_name"]
 
     def clean(self) -> None:
         if self.birth_date > timezone.now().date():
-            raise models.ValidationError({"birth_date": "Birth date cannot be in the future."})
+            raise ValidationError({"birth_date": "Birth date cannot be in the future."})
 
 
 class PatientMerge(TimeStampedModel):
@@ -207,7 +246,10 @@ class Observation(TimeStampedModel):
         ("amended", "Amended"),
     )
 
-    patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name="observations")
+    # Indexed through the leading column of the (patient, code, effective_time) index.
+    patient = models.ForeignKey(
+        Patient, on_delete=models.CASCADE, related_name="observations", db_index=False
+    )
     resource_id = models.CharField(max_length=64, unique=True)
     status = models.CharField(max_length=32, choices=STATUS_CHOICES)
     category = models.CharField(max_length=64)
@@ -219,18 +261,27 @@ class Observation(TimeStampedModel):
     issued = models.DateTimeField(null=True, blank=True)
     performer = models.CharField(max_length=128, blank=True)
 
+    DEFAULT_SELECT_RELATED = ("patient",)
+
     class Meta:
         ordering = ["-effective_time"]
+        indexes = [
+            models.Index(fields=["patient", "code", "-effective_time"]),
+            models.Index(fields=["-effective_time"]),
+        ]
 
     def clean(self) -> None:
         if self.effective_time > timezone.now():
-            raise models.ValidationError({"effective_time": "Effective time cannot be in the future."})
+            raise ValidationError({"effective_time": "Effective time cannot be in the future."})
 
 
 class ObservationAlertConfig(TimeStampedModel):
     """Threshold-based alert configuration per patient and observation."""
 
-    patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name="alert_configs")
+    # Indexed through the leading column of the unique (patient, observation_code) key.
+    patient = models.ForeignKey(
+        Patient, on_delete=models.CASCADE, related_name="alert_configs", db_index=False
+    )
     observation_code = models.CharField(max_length=64)
     thresholds = models.JSONField(default=dict)
     notification_channels = models.JSONField(default=list, blank=True)
@@ -249,7 +300,10 @@ class Appointment(TimeStampedModel):
         ("completed", "Completed"),
     )
 
-    patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name="appointments")
+    # Indexed through the leading column of the (patient, start) index.
+    patient = models.ForeignKey(
+        Patient, on_delete=models.CASCADE, related_name="appointments", db_index=False
+    )
     practitioner_reference = models.CharField(max_length=64)
     status = models.CharField(max_length=32, choices=STATUS_CHOICES, default="booked")
     service_category = models.CharField(max_length=64, blank=True)
@@ -260,22 +314,29 @@ class Appointment(TimeStampedModel):
     location = models.CharField(max_length=128, blank=True)
     notes = models.TextField(blank=True)
 
+    DEFAULT_SELECT_RELATED = ("patient",)
+
     class Meta:
         ordering = ["-start"]
-        indexes = [models.Index(fields=["practitioner_reference", "start"])]
+        indexes = [
+            models.Index(fields=["practitioner_reference", "start"]),
+            models.Index(fields=["patient", "start"]),
+            models.Index(fields=["status", "start"]),
+        ]
 
     def clean(self) -> None:
         if self.end <= self.start:
-            raise models.ValidationError({"end": "End time must be after start time."})
+            raise ValidationError({"end": "End time must be after start time."})
         if self.start < timezone.now():
-            raise models.ValidationError({"start": "Start time must be in the future."})
+            raise ValidationError({"start": "Start time must be in the future."})
 
 
 class WaitlistEntry(TimeStampedModel):
     """Appointment waitlist entries."""
 
+    # Indexed through the leading column of the unique (appointment, patient) key.
     appointment = models.ForeignKey(
-        Appointment, on_delete=models.CASCADE, related_name="waitlist_entries"
+        Appointment, on_delete=models.CASCADE, related_name="waitlist_entries", db_index=False
     )
     patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name="waitlist")
     preferred_dates = models.JSONField(default=list, blank=True)
@@ -352,6 +413,11 @@ class Notification(TimeStampedModel):
     status = models.CharField(max_length=32, default="scheduled")
     channel_statuses = models.JSONField(default=list, blank=True)
 
+    DEFAULT_SELECT_RELATED = ("template",)
+
+    class Meta:
+        indexes = [models.Index(fields=["recipient_id", "status"])]
+
 
 class NotificationCampaign(TimeStampedModel):
     """Bulk notification campaign configuration."""
@@ -370,7 +436,10 @@ class NotificationCampaign(TimeStampedModel):
 class RiskScore(TimeStampedModel):
     """Risk scoring results for patients."""
 
-    patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name="risk_scores")
+    # Indexed through the leading column of the (patient, risk_type, calculated_at) index.
+    patient = models.ForeignKey(
+        Patient, on_delete=models.CASCADE, related_name="risk_scores", db_index=False
+    )
     risk_type = models.CharField(max_length=64)
     score = models.FloatField(validators=[MinValueValidator(0.0)])
     level = models.CharField(max_length=32)
@@ -379,6 +448,11 @@ class RiskScore(TimeStampedModel):
     recommendations = models.JSONField(default=list)
     calculated_at = models.DateTimeField()
 
+    DEFAULT_SELECT_RELATED = ("patient",)
+
+    class Meta:
+        indexes = [models.Index(fields=["patient", "risk_type", "-calculated_at"])]
+
 
 class MLTrainingJob(TimeStampedModel):
     """Represents model training pipeline executions."""
@@ -431,9 +505,15 @@ class PersonalizedAlert(TimeStampedModel):
     recommendations = models.JSONField(default=list)
     fhir_resources = models.JSONField(default=list)
 
+    DEFAULT_SELECT_RELATED = ("patient", "model")
+
 
 class AuditEvent(TimeStampedModel):
-    """Immutable audit log of access events."""
+    """Immutable audit log of access events.
+
+    Only fixed-width columns live here so scans over the audit trail stay
+    narrow; the free-form metadata is stored in :class:`AuditEventPayload`.
+    """
 
     event_type = models.CharField(max_length=64)
     user_id = models.CharField(max_length=64)
@@ -444,9 +524,20 @@ class AuditEvent(TimeStampedModel):
     session_id = models.CharField(max_length=64, blank=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.CharField(max_length=255, blank=True)
-    metadata = models.JSONField(default=dict)
     immutable_hash = models.CharField(max_length=128, blank=True)
 
+    DEFAULT_SELECT_RELATED = ("payload",)
+
+    class Meta:
+        indexes = [models.Index(fields=["-created_at"])]
+
+
+class AuditEventPayload(TimeStampedModel):
+    """Free-form metadata attached to an audit event."""
+
+    event = models.OneToOneField(AuditEvent, on_delete=models.CASCADE, related_name="payload")
+    metadata = models.JSONField(default=dict)
+
 
 class AuditExport(TimeStampedModel):
     """Audit export jobs."""
@@ -477,10 +568,16 @@ class FhirAccessLog(TimeStampedModel):
     response_payload = models.JSONField(default=dict)
     occurred_at = models.DateTimeField(default=timezone.now)
 
+    LIST_DEFER = ("response_payload",)
+
+    class Meta:
+        indexes = [models.Index(fields=["-created_at"])]
+
 
 __all__ = [
     "AuditAnomaly",
     "AuditEvent",
+    "AuditEventPayload",
     "AuditExport",
     "FhirAccessLog",
     "HL7Batch",
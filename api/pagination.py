@@ -1,5 +1,5 @@
 """API pagination utilities."""
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -8,3 +8,18 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size = 25
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class CursorResultsPagination(CursorPagination):
+    """Keyset pagination for large append-only tables, constant cost at any depth."""
+
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
+
+
+class EffectiveTimeCursorPagination(CursorResultsPagination):
+    """Keyset pagination for clinical records ordered by effective time."""
+
+    ordering = "-effective_time"
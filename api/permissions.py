@@ -1,11 +1,22 @@
 """Custom DRF permission classes for RBAC enforcement."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Tuple
 
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 
-from .rbac import get_user_roles, user_has_permission
+from .rbac import user_has_permission
+from .rbac_cache import RBACPayload, get_cached_roles_and_permissions
+
+_WRITE_ROLES = frozenset({"MANAGER", "ADMIN"})
+
+
+def _request_rbac(request) -> RBACPayload:
+    """Resolve RBAC data for the request, keyed on the access token's ``jti`` claim."""
+    payload = getattr(getattr(request, "auth", None), "payload", None) or {}
+    return get_cached_roles_and_permissions(request.user, payload.get("jti"))
 
 
 class IsAdmin(BasePermission):
@@ -14,7 +25,9 @@ class IsAdmin(BasePermission):
     message = "You must be an admin to perform this action."
 
     def has_permission(self, request, view) -> bool:
-        return "ADMIN" in get_user_roles(request.user)
+        if request.user.is_superuser:
+            return True
+        return "ADMIN" in _request_rbac(request).roles
 
 
 class IsManagerOrReadOnly(BasePermission):
@@ -25,36 +38,71 @@ class IsManagerOrReadOnly(BasePermission):
     def has_permission(self, request, view) -> bool:
         if request.method in SAFE_METHODS:
             return True
-        return "MANAGER" in get_user_roles(request.user) or "ADMIN" in get_user_roles(request.user)
+        return not _WRITE_ROLES.isdisjoint(_request_rbac(request).roles)
 
 
+@lru_cache(maxsize=256)
 def HasEntityPermission(entity: str, action: str) -> type:
-    """Return a permission class verifying the given entity/action combination."""
+    """Return a permission class verifying the given entity/action combination.
+
+    Classes are memoized so each entity/action pair maps to a single class object.
+    """
 
     class _HasEntityPermission(BasePermission):
         message = "You do not have permission to perform this action."
 
         def has_permission(self, request, view) -> bool:
-            return user_has_permission(request.user, entity, action)
+            if request.user.is_superuser:
+                return True
+            index = _request_rbac(request).permission_index
+            return user_has_permission(request.user, entity, action, permission_index=index)
 
         def has_object_permission(self, request, view, obj) -> bool:
-            return user_has_permission(request.user, entity, action, obj=obj)
+            if request.user.is_superuser:
+                return True
+            index = _request_rbac(request).permission_index
+            return user_has_permission(request.user, entity, action, obj=obj, permission_index=index)
 
     _HasEntityPermission.__name__ = f"HasPermission_{entity}_{action}"
     return _HasEntityPermission
 
 
+@lru_cache(maxsize=256)
+def _entity_permission(entity: str, action: str) -> BasePermission:
+    """Return a shared instance of ``HasEntityPermission(entity, action)``.
+
+    The permission classes hold no per-request state, so one instance per pair is reused.
+    """
+    return HasEntityPermission(entity, action)()
+
+
 class ActionPermissionMixin:
-    """Mixin to map viewset actions to RBAC requirements."""
+    """Mixin to map viewset actions to RBAC requirements.
+
+    ``action_permission_map`` is checked against the class's handlers when a
+    subclass is defined, and each entry is resolved to its shared permission
+    instance up front.
+    """
 
     action_permission_map: Dict[str, Tuple[str, str]] = {}
+    _action_permissions: Dict[str, BasePermission] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        resolved: Dict[str, BasePermission] = {}
+        for action_name, (entity, action) in cls.action_permission_map.items():
+            if not callable(getattr(cls, action_name, None)):
+                raise ImproperlyConfigured(
+                    f"{cls.__name__}.action_permission_map names unknown action {action_name!r}"
+                )
+            resolved[action_name] = _entity_permission(entity, action)
+        cls._action_permissions = resolved
 
     def get_permissions(self):  # type: ignore[override]
         permissions = super().get_permissions()  # type: ignore[misc]
-        entity_action = self.action_permission_map.get(getattr(self, "action", ""))
-        if entity_action:
-            entity, action = entity_action
-            permissions.append(HasEntityPermission(entity, action)())
+        permission = self._action_permissions.get(getattr(self, "action", None))
+        if permission is not None:
+            permissions.append(permission)
         return permissions
 
 
@@ -1,13 +1,16 @@
 """Role based access control helpers."""
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 
-from .models import UserRole
+from .models import Role
 
 User = get_user_model()
 
@@ -40,27 +43,129 @@ ROLE_PERMISSIONS: Dict[str, Dict[str, List[str]]] = {
     "VIEWER": {"*": ["read"]},
 }
 
+# Frozen view of ROLE_PERMISSIONS so role permissions can be merged with set unions.
+_ROLE_PERMISSIONS_FS: Dict[str, Dict[str, FrozenSet[str]]] = {
+    role: {entity: frozenset(actions) for entity, actions in mapping.items()}
+    for role, mapping in ROLE_PERMISSIONS.items()
+}
+
+
+def build_permission_index(permissions: Dict[str, Iterable[str]]) -> FrozenSet[str]:
+    """Return the ``"entity:action"`` set used for constant-time permission checks."""
+    return frozenset(f"{entity}:{action}" for entity, actions in permissions.items() for action in actions)
+
+
+# Per-role "entity:action" indexes, shared by every user holding exactly one role.
+_ROLE_PERMISSION_INDEX: Dict[str, FrozenSet[str]] = {
+    role: build_permission_index(mapping) for role, mapping in ROLE_PERMISSIONS.items()
+}
+
+_ROLE_CACHE_GENERATION_KEY = "rbac:roles:generation"
+
 
-def _load_user_roles(user: User) -> Iterable[UserRole]:
-    """Return the active role assignments for the user."""
+def _load_user_roles(user: User) -> Iterable[Tuple[str, datetime, Optional[datetime]]]:
+    """Return ``(role name, effective_date, expiry_date)`` for the user's unexpired assignments."""
     now = timezone.now()
     return (
-        user.role_assignments.filter(effective_date__lte=now)
-        .filter(models.Q(expiry_date__isnull=True) | models.Q(expiry_date__gt=now))
-        .select_related("role")
+        user.role_assignments.filter(models.Q(expiry_date__isnull=True) | models.Q(expiry_date__gt=now))
+        .order_by()
+        .values_list("role__name", "effective_date", "expiry_date")
     )
 
 
-def get_user_roles(user: User) -> List[str]:
-    """Return the list of active role names for a user."""
+def _role_cache_generation() -> int:
+    return cache.get_or_set(_ROLE_CACHE_GENERATION_KEY, 0, None)
+
+
+def _role_cache_key(user_id: int) -> str:
+    return f"rbac:roles:{_role_cache_generation()}:{user_id}"
+
+
+def _get_active_role_names(user: User) -> FrozenSet[str]:
+    """Return the user's active role names, cached until an assignment changes or its window ends."""
+    key = _role_cache_key(user.pk)
+    role_names = cache.get(key)
+    if role_names is None:
+        now = timezone.now()
+        # Signals only clear this process's cache, so the TTL bounds staleness in other workers.
+        timeout = float(getattr(settings, "RBAC_ROLE_CACHE_SECONDS", 5))
+        active = set()
+        for name, effective_date, expiry_date in _load_user_roles(user):
+            if effective_date <= now:
+                # Case-only duplicates left lower-case by the uppercase_role_names migration still match.
+                active.add(name.upper())
+            else:
+                timeout = min(timeout, (effective_date - now).total_seconds())
+            if expiry_date is not None:
+                timeout = min(timeout, (expiry_date - now).total_seconds())
+        role_names = frozenset(active)
+        cache.set(key, role_names, max(timeout, 1))
+    return role_names
+
+
+def invalidate_user_roles(user_id: int) -> None:
+    """Forget the cached role names for one user."""
+    cache.delete(_role_cache_key(user_id))
+
+
+def invalidate_all_user_roles() -> None:
+    """Forget cached role names for every user and cached role ids, e.g. after a role is renamed."""
+    try:
+        cache.incr(_ROLE_CACHE_GENERATION_KEY)
+    except ValueError:
+        cache.set(_ROLE_CACHE_GENERATION_KEY, 1, None)
+
+
+# Attributes used to memoize RBAC lookups on the (request-scoped) user instance.
+_USER_MEMO_ATTRS = (
+    "_rbac_role_set_cache",
+    "_rbac_roles_cache",
+    "_rbac_perms_cache",
+    "_rbac_permission_index",
+)
+
+
+def clear_user_memo(user: User) -> None:
+    """Drop RBAC results memoized on a user instance, e.g. after its assignments change."""
+    for attr in _USER_MEMO_ATTRS:
+        user.__dict__.pop(attr, None)
+
+
+def _get_user_roles_unsorted(user: User) -> FrozenSet[str]:
+    """Return the user's active role names as a set, memoized on the user instance."""
     if not user.is_authenticated:
-        return []
+        return frozenset()
     if user.is_superuser:
-        return ["ADMIN"]
-    role_names = {assignment.role.name.upper() for assignment in _load_user_roles(user)}
-    if not role_names and user.is_staff:
-        role_names.add("MANAGER")
-    return sorted(role_names)
+        return frozenset({"ADMIN"})
+    role_names = getattr(user, "_rbac_role_set_cache", None)
+    if role_names is None:
+        role_names = _get_active_role_names(user)
+        if not role_names and user.is_staff:
+            role_names = frozenset({"MANAGER"})
+        user._rbac_role_set_cache = role_names
+    return role_names
+
+
+def get_user_roles(user: User) -> List[str]:
+    """Return the sorted list of active role names for a user."""
+    roles = getattr(user, "_rbac_roles_cache", None)
+    if roles is None:
+        roles = sorted(_get_user_roles_unsorted(user))
+        user._rbac_roles_cache = roles
+    return roles
+
+
+def get_role_id(name: str) -> Optional[int]:
+    """Return the primary key of the named role, cached until a role changes or the TTL ends."""
+    name = name.upper()
+    key = f"rbac:role-id:{_role_cache_generation()}:{name}"
+    role_id = cache.get(key)
+    if role_id is None:
+        role_id = Role.objects.filter(name=name).values_list("pk", flat=True).first()
+        # Misses are not cached: the role may be seeded by another process without a signal here.
+        if role_id is not None:
+            cache.set(key, role_id, getattr(settings, "RBAC_ROLE_CACHE_SECONDS", 5))
+    return role_id
 
 
 def get_permissions_for_role(role_name: str) -> Dict[str, List[str]]:
@@ -68,37 +173,67 @@ def get_permissions_for_role(role_name: str) -> Dict[str, List[str]]:
     return ROLE_PERMISSIONS.get(role_name.upper(), {})
 
 
+def get_permissions_for_roles(roles: Iterable[str]) -> Dict[str, List[str]]:
+    """Aggregate permissions across the given role names."""
+    merged: Dict[str, Set[str]] = {}
+    for role in roles:
+        for entity, actions in _ROLE_PERMISSIONS_FS.get(role.upper(), {}).items():
+            merged.setdefault(entity, set()).update(actions)
+    return {entity: sorted(actions) for entity, actions in merged.items()}
+
+
 def get_permissions_for_user(user: User) -> Dict[str, List[str]]:
-    """Aggregate permissions across all of a user's roles."""
-    permissions: Dict[str, List[str]] = {}
-    for role in get_user_roles(user):
-        for entity, actions in get_permissions_for_role(role).items():
-            permissions.setdefault(entity, [])
-            for action in actions:
-                if action not in permissions[entity]:
-                    permissions[entity].append(action)
+    """Aggregate permissions across all of a user's roles, memoized on the user instance."""
+    permissions = getattr(user, "_rbac_perms_cache", None)
+    if permissions is None:
+        permissions = get_permissions_for_roles(_get_user_roles_unsorted(user))
+        user._rbac_perms_cache = permissions
     return permissions
 
 
-def _matches_entity(entity_permissions: Dict[str, List[str]], entity: str, action: str) -> bool:
-    if action in entity_permissions.get("*", []):
-        return True
-    if action in entity_permissions.get(entity, []):
-        return True
-    if "*" in entity_permissions and "*" in entity_permissions["*"]:
-        return True
-    return False
+def get_permission_index_for_user(user: User) -> FrozenSet[str]:
+    """Return the user's permission index, memoized on the (request-scoped) user instance."""
+    index = getattr(user, "_rbac_permission_index", None)
+    if index is None:
+        roles = _get_user_roles_unsorted(user)
+        if len(roles) == 1:
+            # Most users hold a single role; reuse its precomputed index instead of merging.
+            (role,) = roles
+            index = _ROLE_PERMISSION_INDEX.get(role.upper(), frozenset())
+        else:
+            index = build_permission_index(get_permissions_for_user(user))
+        user._rbac_permission_index = index
+    return index
+
+
+def _matches_entity(permission_index: FrozenSet[str], entity: str, action: str) -> bool:
+    return (
+        f"{entity}:{action}" in permission_index
+        or f"*:{action}" in permission_index
+        or "*:*" in permission_index
+    )
+
 
+def user_has_permission(
+    user: User,
+    entity: str,
+    action: str,
+    obj: Optional[object] = None,
+    permission_index: Optional[FrozenSet[str]] = None,
+) -> bool:
+    """Evaluate whether the user has permission for the entity/action combination.
 
-def user_has_permission(user: User, entity: str, action: str, obj: Optional[object] = None) -> bool:
-    """Evaluate whether the user has permission for the entity/action combination."""
+    ``permission_index`` may carry an already resolved index for the user to
+    avoid reloading role assignments.
+    """
     if not user.is_authenticated:
         return False
     if user.is_superuser:
         return True
 
-    entity_permissions = get_permissions_for_user(user)
-    if _matches_entity(entity_permissions, entity, action):
+    if permission_index is None:
+        permission_index = get_permission_index_for_user(user)
+    if _matches_entity(permission_index, entity, action):
         return True
 
     if obj is not None and action in {"read", "update", "delete"}:
@@ -115,8 +250,15 @@ def user_has_permission(user: User, entity: str, action: str, obj: Optional[obje
 
 __all__ = [
     "ROLE_PERMISSIONS",
+    "build_permission_index",
+    "clear_user_memo",
+    "get_permission_index_for_user",
     "get_permissions_for_role",
+    "get_permissions_for_roles",
     "get_permissions_for_user",
+    "get_role_id",
     "get_user_roles",
+    "invalidate_all_user_roles",
+    "invalidate_user_roles",
     "user_has_permission",
 ]
@@ -0,0 +1,105 @@
+"""Short-lived, process-wide cache for resolved RBAC payloads."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Hashable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+
+from .rbac import _get_user_roles_unsorted, get_permission_index_for_user, get_permissions_for_user
+
+
+class RBACPayload(NamedTuple):
+    roles: FrozenSet[str]
+    permissions: Dict[str, List[str]]
+    permission_index: FrozenSet[str]
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after insertion."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard_where(self, predicate) -> None:
+        """Drop every entry whose key satisfies ``predicate``."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _cache_ttl() -> float:
+    """Keep the TTL at or below the access-token lifetime to bound stale grants."""
+    ttl = float(getattr(settings, "RBAC_CACHE_SECONDS", 5))
+    access_lifetime = getattr(settings, "SIMPLE_JWT", {}).get("ACCESS_TOKEN_LIFETIME")
+    if access_lifetime is not None:
+        ttl = min(ttl, access_lifetime.total_seconds())
+    return ttl
+
+
+_payload_cache = TTLCache(maxsize=10_000, ttl=_cache_ttl())
+
+
+def _resolve_payload(user) -> RBACPayload:
+    roles = _get_user_roles_unsorted(user)
+    permissions = get_permissions_for_user(user)
+    return RBACPayload(roles, permissions, get_permission_index_for_user(user))
+
+
+def get_cached_roles_and_permissions(user, jti: Optional[str]) -> RBACPayload:
+    """Return the RBAC payload for the user, reusing recent results for the same token."""
+    if not user.is_authenticated or not jti:
+        return _resolve_payload(user)
+
+    key = (user.pk, jti)
+    payload = _payload_cache.get(key)
+    if payload is None:
+        payload = _resolve_payload(user)
+        _payload_cache.set(key, payload)
+    return payload
+
+
+def invalidate_user(user_id: Any) -> None:
+    """Forget every cached payload belonging to the given user."""
+    _payload_cache.discard_where(lambda key: key[0] == user_id)
+
+
+def clear() -> None:
+    """Forget every cached payload, e.g. after a role definition changes."""
+    _payload_cache.clear()
+
+
+__all__ = [
+    "RBACPayload",
+    "TTLCache",
+    "clear",
+    "get_cached_roles_and_permissions",
+    "invalidate_user",
+]
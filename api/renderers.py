@@ -0,0 +1,36 @@
+"""JSON rendering backed by orjson."""
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Datetimes are passed through to DRF's encoder so their formatting ("Z" suffix) is unchanged.
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+_fallback_default = JSONEncoder().default
+
+
+def orjson_dumps(data: Any) -> bytes:
+    """Encode ``data`` exactly as :class:`ORJSONRenderer` does for compact output."""
+    return orjson.dumps(data, default=_fallback_default, option=_ORJSON_OPTIONS)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Render compact JSON with orjson, deferring unsupported types to DRF's encoder."""
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson_dumps(data)
+
+
+__all__ = ["ORJSONRenderer", "orjson_dumps"]
@@ -1,11 +1,14 @@
 """Serializers for the FHIR Patient Portal API."""
 from __future__ import annotations
 
+import copy
+import hashlib
 import re
 from typing import Any, Dict, List
 
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 from rest_framework import serializers
 
@@ -13,6 +16,7 @@ from .models import (
     Appointment,
     AuditAnomaly,
     AuditEvent,
+    AuditEventPayload,
     AuditExport,
     HL7Batch,
     HL7Message,
@@ -32,13 +36,43 @@ from .models import (
     TelemedicineConsent,
     TelemedicineMetric,
     TelemedicineSession,
+    UserProfile,
     UserRole,
     WaitlistEntry,
     PHONE_VALIDATOR,
 )
+from .rbac import get_role_id, get_user_roles
 
 User = get_user_model()
 
+_PASSWORD_RULES = (
+    (re.compile(r"[A-Z]"), "include at least one uppercase letter"),
+    (re.compile(r"[a-z]"), "include at least one lowercase letter"),
+    (re.compile(r"[0-9]"), "include at least one digit"),
+    (re.compile(r"[^A-Za-z0-9]"), "include at least one special character"),
+)
+
+_GENDER_CHOICES = frozenset(choice[0] for choice in Patient.GENDER_CHOICES)
+_EXPORT_FORMATS = frozenset(choice[0] for choice in PatientExport.FORMAT_CHOICES)
+_HL7_VERSIONS = frozenset({"2.3", "2.4", "2.5", "2.6", "2.7", "2.8"})
+
+
+class PrecompiledFieldsMixin:
+    """Introspect a ModelSerializer's fields once per class and hand out copies.
+
+    ``ModelSerializer.get_fields`` rebuilds every field from model metadata on
+    each instantiation; only use this for serializers whose fields do not
+    depend on the instance or context.
+    """
+
+    def get_fields(self) -> Dict[str, serializers.Field]:
+        cls = type(self)
+        prototype = cls.__dict__.get("_prototype_fields")
+        if prototype is None:
+            prototype = super().get_fields()  # type: ignore[misc]
+            cls._prototype_fields = prototype
+        return copy.deepcopy(prototype)
+
 
 class RegistrationProfileSerializer(serializers.Serializer):
     first_name = serializers.CharField(max_length=150)
@@ -68,25 +102,19 @@ class UserRegistrationSerializer(serializers.Serializer):
         default="email",
     )
 
-    password_rules = (
-        (re.compile(r"[A-Z]"), "include at least one uppercase letter"),
-        (re.compile(r"[a-z]"), "include at least one lowercase letter"),
-        (re.compile(r"[0-9]"), "include at least one digit"),
-        (re.compile(r"[^A-Za-z0-9]"), "include at least one special character"),
-    )
-
     def validate_email(self, value: str) -> str:
-        if User.objects.filter(email__iexact=value).exists():
+        # Compare on LOWER(email) so the lookup can use auth_user_email_lower_idx.
+        if User.objects.alias(email_lower=Lower("email")).filter(email_lower=value.lower()).exists():
             raise serializers.ValidationError("A user with this email already exists.")
         return value
 
     def validate_password(self, value: str) -> str:
-        missing = [message for pattern, message in self.password_rules if not pattern.search(value)]
-        if missing:
-            raise serializers.ValidationError(
-                "Password must " + ", ".join(missing) + "."
-            )
-        return value
+        if all(pattern.search(value) for pattern, _ in _PASSWORD_RULES):
+            return value
+        missing = [message for pattern, message in _PASSWORD_RULES if not pattern.search(value)]
+        raise serializers.ValidationError(
+            "Password must " + ", ".join(missing) + "."
+        )
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         if attrs.get("password") != attrs.get("confirm_password"):
@@ -105,38 +133,39 @@ class UserRegistrationSerializer(serializers.Serializer):
         email = validated_data["email"]
         password = validated_data["password"]
 
-        user = User.objects.create_user(
-            username=email,
-            email=email,
-            password=password,
-            first_name=profile_data.get("first_name", ""),
-            last_name=profile_data.get("last_name", ""),
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=email,
+                    email=email,
+                    password=password,
+                    first_name=profile_data.get("first_name", ""),
+                    last_name=profile_data.get("last_name", ""),
+                )
+        except IntegrityError:
+            # A concurrent registration claimed the same username after validate_email ran.
+            raise serializers.ValidationError({"email": "A user with this email already exists."})
+
+        # The profile row was just created by the post_save signal, so its device_info is empty.
+        now = timezone.now()
+        UserProfile.objects.filter(user=user).update(
+            phone=profile_data.get("phone", ""),
+            date_of_birth=profile_data.get("date_of_birth"),
+            device_info={
+                "verification_method": verification_method,
+                "terms_accepted_at": now.isoformat(),
+            },
+            updated_at=now,
         )
 
-        profile = getattr(user, "profile", None)
-        if profile:
-            profile.phone = profile_data.get("phone", "")
-            profile.date_of_birth = profile_data.get("date_of_birth")
-            metadata = profile.device_info or {}
-            metadata.update(
-                {
-                    "verification_method": verification_method,
-                    "terms_accepted_at": timezone.now().isoformat(),
-                }
-            )
-            profile.device_info = metadata
-            profile.save()
-
-        patient_role = Role.objects.filter(name__iexact="PATIENT").first()
-        if patient_role:
-            UserRole.objects.create(user=user, role=patient_role, reason="Self registration")
+        patient_role_id = get_role_id("PATIENT")
+        if patient_role_id:
+            UserRole.objects.create(user=user, role_id=patient_role_id, reason="Self registration")
 
         self.instance = user
         return user
 
     def to_representation(self, instance: User) -> Dict[str, Any]:
-        from .rbac import get_user_roles
-
         return {
             "id": instance.pk,
             "email": instance.email,
@@ -150,6 +179,16 @@ class RoleSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "description", "permissions", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
 
+    def validate_name(self, value: str) -> str:
+        # Role.save() upper-cases names, so uniqueness has to be checked on the stored form.
+        value = value.upper()
+        queryset = Role.objects.filter(name=value)
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        if queryset.exists():
+            raise serializers.ValidationError("role with this name already exists.")
+        return value
+
 
 class UserRoleSerializer(serializers.ModelSerializer):
     role = RoleSerializer(read_only=True)
@@ -177,11 +216,15 @@ class UserRoleAssignSerializer(serializers.Serializer):
     expiry_date = serializers.DateTimeField(required=False, allow_null=True)
     reason = serializers.CharField(required=False, allow_blank=True)
 
-    def validate_roles(self, value: List[str]) -> List[str]:
-        unknown = [role for role in value if not Role.objects.filter(name__iexact=role).exists()]
+    def validate_roles(self, value: List[str]) -> Dict[str, int]:
+        """Return ``{role name: role id}`` for the requested roles, de-duplicated in request order."""
+        known = dict(
+            Role.objects.filter(name__in={role.upper() for role in value}).values_list("name", "pk")
+        )
+        unknown = [role for role in value if role.upper() not in known]
         if unknown:
             raise serializers.ValidationError(f"Unknown roles: {', '.join(unknown)}")
-        return value
+        return {role.upper(): known[role.upper()] for role in value}
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         effective_date = attrs.get("effective_date", timezone.now())
@@ -192,7 +235,40 @@ class UserRoleAssignSerializer(serializers.Serializer):
         return attrs
 
 
-class HL7BatchSerializer(serializers.ModelSerializer):
+class HL7BatchMessageSerializer(serializers.Serializer):
+    """Message entry inside a batch; uniqueness is left to the bulk insert."""
+
+    message_id = serializers.CharField(max_length=64, required=False)
+    correlation_id = serializers.CharField(max_length=64, required=False, allow_blank=True)
+    raw_message = serializers.CharField()
+    hl7_version = serializers.CharField(max_length=16, required=False)
+    sending_application = serializers.CharField(max_length=128, required=False, allow_blank=True)
+    receiving_application = serializers.CharField(max_length=128, required=False, allow_blank=True)
+
+    def validate_hl7_version(self, value: str) -> str:
+        if value not in _HL7_VERSIONS:
+            raise serializers.ValidationError("Unsupported HL7 version")
+        return value
+
+
+def _batch_message_id(batch_id: str, index: int) -> str:
+    """Return ``"<batch_id>-<index>"``, shortened to fit ``HL7Message.message_id``.
+
+    The batch insert ignores conflicts, so an over-long id would be truncated
+    by MySQL into a collision and the message silently dropped.
+    """
+    suffix = f"-{index}"
+    max_length = HL7Message._meta.get_field("message_id").max_length
+    if len(batch_id) + len(suffix) > max_length:
+        # Keep a digest of the full id so long batch ids sharing a prefix stay distinct.
+        digest = hashlib.sha1(batch_id.encode()).hexdigest()[:12]
+        batch_id = f"{batch_id[: max_length - len(suffix) - len(digest) - 1]}-{digest}"
+    return f"{batch_id}{suffix}"
+
+
+class HL7BatchSerializer(PrecompiledFieldsMixin, serializers.ModelSerializer):
+    messages = HL7BatchMessageSerializer(many=True, write_only=True, required=False)
+
     class Meta:
         model = HL7Batch
         fields = [
@@ -204,13 +280,39 @@ class HL7BatchSerializer(serializers.ModelSerializer):
             "failed",
             "processing_time",
             "metadata",
+            "messages",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
+    @transaction.atomic
+    def create(self, validated_data: Dict[str, Any]) -> HL7Batch:
+        messages = validated_data.pop("messages", [])
+        if messages:
+            validated_data["total_messages"] = len(messages)
+        batch = super().create(validated_data)
+        if messages:
+            # Duplicate message ids are skipped by the database instead of checked one by one.
+            HL7Message.objects.bulk_create(
+                [
+                    HL7Message(
+                        batch=batch,
+                        message_id=message.pop("message_id", None) or _batch_message_id(batch.batch_id, index),
+                        **message,
+                    )
+                    for index, message in enumerate(messages, start=1)
+                ],
+                batch_size=500,
+                ignore_conflicts=True,
+            )
+            batch.processed = batch.messages.count()
+            batch.failed = len(messages) - batch.processed
+            batch.save(update_fields=["processed", "failed", "updated_at"])
+        return batch
 
-class HL7MessageSerializer(serializers.ModelSerializer):
+
+class HL7MessageSerializer(PrecompiledFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = HL7Message
         fields = [
@@ -232,8 +334,7 @@ class HL7MessageSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
     def validate_hl7_version(self, value: str) -> str:
-        allowed = {"2.3", "2.4", "2.5", "2.6", "2.7", "2.8"}
-        if value not in allowed:
+        if value not in _HL7_VERSIONS:
             raise serializers.ValidationError("Unsupported HL7 version")
         return value
 
@@ -282,7 +383,7 @@ class PatientSerializer(serializers.ModelSerializer):
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         if not attrs.get("first_name") or not attrs.get("last_name"):
             raise serializers.ValidationError("First and last name are required.")
-        if attrs.get("gender") not in {choice[0] for choice in Patient.GENDER_CHOICES}:
+        if attrs.get("gender") not in _GENDER_CHOICES:
             raise serializers.ValidationError({"gender": "Invalid gender value."})
         return attrs
 
@@ -323,8 +424,7 @@ class PatientExportSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at"]
 
     def validate_format(self, value: str) -> str:
-        valid = {choice[0] for choice in PatientExport.FORMAT_CHOICES}
-        if value not in valid:
+        if value not in _EXPORT_FORMATS:
             raise serializers.ValidationError("Unsupported export format")
         return value
 
@@ -622,7 +722,17 @@ class PersonalizedAlertSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
+class AuditPayloadMetadataField(serializers.JSONField):
+    """``payload.metadata`` that renders ``{}`` for events stored without a payload row."""
+
+    def get_attribute(self, instance: AuditEvent) -> Any:
+        payload = getattr(instance, "payload", None)
+        return payload.metadata if payload is not None else {}
+
+
 class AuditEventSerializer(serializers.ModelSerializer):
+    metadata = AuditPayloadMetadataField(source="payload.metadata", default=dict)
+
     class Meta:
         model = AuditEvent
         fields = [
@@ -643,6 +753,23 @@ class AuditEventSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
+    @transaction.atomic
+    def create(self, validated_data: Dict[str, Any]) -> AuditEvent:
+        metadata = validated_data.pop("payload", {}).get("metadata", {})
+        event = super().create(validated_data)
+        AuditEventPayload.objects.create(event=event, metadata=metadata)
+        return event
+
+    @transaction.atomic
+    def update(self, instance: AuditEvent, validated_data: Dict[str, Any]) -> AuditEvent:
+        payload = validated_data.pop("payload", None)
+        event = super().update(instance, validated_data)
+        if payload is not None:
+            event.payload, _ = AuditEventPayload.objects.update_or_create(
+                event=event, defaults={"metadata": payload.get("metadata", {})}
+            )
+        return event
+
 
 class AuditExportSerializer(serializers.ModelSerializer):
     class Meta:
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import UserProfile
+from . import rbac_cache
+from .models import Role, UserProfile, UserRole
+from .rbac import clear_user_memo, invalidate_all_user_roles, invalidate_user_roles
 
 User = get_user_model()
 
@@ -14,11 +16,22 @@ User = get_user_model()
 def create_user_profile(sender, instance: User, created: bool, **_: dict) -> None:
     """Ensure each user has a profile for RBAC metadata."""
     if created:
-        UserProfile.objects.create(user=instance)
+        UserProfile.objects.get_or_create(user=instance)
+        # A new account never has role assignments; drop anything cached under a reused pk.
+        invalidate_user_roles(instance.pk)
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance: User, **_: dict) -> None:
-    """Persist related profile when a user is saved."""
-    if hasattr(instance, "profile"):
-        instance.profile.save()
+@receiver([post_save, post_delete], sender=UserRole)
+def invalidate_user_role_cache(sender, instance: UserRole, **_: dict) -> None:
+    """Drop cached RBAC payloads for a user whose role assignments changed."""
+    invalidate_user_roles(instance.user_id)
+    rbac_cache.invalidate_user(instance.user_id)
+    if UserRole.user.is_cached(instance):
+        clear_user_memo(instance.user)
+
+
+@receiver([post_save, post_delete], sender=Role)
+def invalidate_role_cache(sender, instance: Role, **_: dict) -> None:
+    """Drop all cached RBAC payloads when a role definition changes."""
+    invalidate_all_user_roles()
+    rbac_cache.clear()
@@ -74,3 +74,19 @@ class UserRegistrationAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("email", response.data)
 
+
+class MeAPITests(APITestCase):
+    def setUp(self) -> None:
+        self.role = Role.objects.create(name="STAFF", permissions={})
+        self.user = get_user_model().objects.create_user("staff@example.com", password="pass12345")
+        UserRole.objects.create(user=self.user, role=self.role)
+        self.url = reverse("auth_me")
+
+    def test_me_resolves_roles_once(self):
+        self.client.force_authenticate(get_user_model().objects.get(pk=self.user.pk))
+        # One query for the profile, one for the active role assignments.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["roles"], ["STAFF"])
+        self.assertIn("patients", response.data["permissions"])
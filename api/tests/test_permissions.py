@@ -4,10 +4,12 @@ from __future__ import annotations
 from datetime import date
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 
 from ..models import Patient, Role, UserRole
-from ..rbac import get_permissions_for_user, user_has_permission
+from .. import rbac_cache
+from ..rbac import get_permissions_for_user, get_role_id, get_user_roles, user_has_permission
 
 User = get_user_model()
 
@@ -41,3 +43,67 @@ class PermissionTests(TestCase):
 
     def test_staff_cannot_delete_without_permission(self):
         self.assertFalse(user_has_permission(self.staff_user, "patients", "delete", obj=self.patient))
+
+
+class RBACCacheTests(TestCase):
+    def setUp(self) -> None:
+        rbac_cache.clear()
+        self.user = User.objects.create_user("cached@test.com", password="pass12345")
+        self.role = Role.objects.create(name="STAFF", permissions={})
+
+    def test_payload_reused_for_same_token(self):
+        rbac_cache.get_cached_roles_and_permissions(self.user, "jti-1")
+        with self.assertNumQueries(0):
+            roles = rbac_cache.get_cached_roles_and_permissions(self.user, "jti-1").roles
+        self.assertEqual(roles, frozenset())
+
+    def test_role_assignment_invalidates_payload(self):
+        rbac_cache.get_cached_roles_and_permissions(self.user, "jti-1")
+        UserRole.objects.create(user=self.user, role=self.role)
+        roles, permissions, _ = rbac_cache.get_cached_roles_and_permissions(self.user, "jti-1")
+        self.assertEqual(roles, frozenset({"STAFF"}))
+        self.assertIn("patients", permissions)
+
+    def test_role_names_cached_across_requests(self):
+        UserRole.objects.create(user=self.user, role=self.role)
+        get_user_roles(User.objects.get(pk=self.user.pk))
+        fresh_user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_roles(fresh_user), ["STAFF"])
+
+    def test_roles_memoized_on_user_instance(self):
+        UserRole.objects.create(user=self.user, role=self.role)
+        user = User.objects.get(pk=self.user.pk)
+        get_permissions_for_user(user)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_roles(user), ["STAFF"])
+            get_permissions_for_user(user)
+        UserRole.objects.filter(user=user).delete()
+        UserRole.objects.create(user=user, role=Role.objects.create(name="VIEWER", permissions={}))
+        self.assertEqual(get_user_roles(user), ["VIEWER"])
+
+    def test_legacy_lowercase_role_grants_permissions(self):
+        # Role.save upper-cases names; update() mimics a case-only duplicate the migration skipped.
+        legacy_role = Role.objects.create(name="LEGACY")
+        Role.objects.filter(pk=legacy_role.pk).update(name="admin")
+        UserRole.objects.create(user=self.user, role=legacy_role)
+        user = User.objects.get(pk=self.user.pk)
+        self.assertEqual(get_user_roles(user), ["ADMIN"])
+        self.assertTrue(user_has_permission(user, "patients", "delete"))
+
+
+class RoleIdLookupTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_role_id_cached(self):
+        role = Role.objects.create(name="PATIENT")
+        self.assertEqual(get_role_id("patient"), role.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_role_id("PATIENT"), role.pk)
+
+    def test_missing_role_is_not_cached(self):
+        self.assertIsNone(get_role_id("PATIENT"))
+        # bulk_create sends no post_save, like a role seeded from another process.
+        Role.objects.bulk_create([Role(name="PATIENT")])
+        self.assertEqual(get_role_id("PATIENT"), Role.objects.get(name="PATIENT").pk)
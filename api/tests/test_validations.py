@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 from django.utils import timezone
 
@@ -25,6 +26,19 @@ class PatientSerializerTests(TestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn("birth_date", serializer.errors)
 
+    def test_model_clean_rejects_future_birth_date(self):
+        patient = Patient(
+            resource_id="patient-clean",
+            primary_identifier="MRN-CLEAN",
+            first_name="Future",
+            last_name="Person",
+            gender="male",
+            birth_date=timezone.now().date() + timedelta(days=1),
+        )
+        with self.assertRaises(ValidationError) as ctx:
+            patient.clean()
+        self.assertIn("birth_date", ctx.exception.message_dict)
+
 
 class AppointmentSerializerTests(TestCase):
     def setUp(self) -> None:
@@ -0,0 +1,235 @@
+"""Tests for API endpoints."""
+from __future__ import annotations
+
+import json
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from ..fast_serializers import FastPatientSerializer
+from ..models import (
+    Appointment,
+    AuditEvent,
+    AuditEventPayload,
+    HL7Message,
+    Observation,
+    Patient,
+    Role,
+    UserRole,
+)
+from ..serializers import PatientSerializer
+
+User = get_user_model()
+
+
+class ListQueryCountTests(APITestCase):
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser("root@test.com", password="pass12345")
+        self.client.force_authenticate(self.admin)
+        start = timezone.now() + timedelta(days=1)
+        for index in range(3):
+            patient = Patient.objects.create(
+                resource_id=f"patient-{index}",
+                primary_identifier=f"MRN{index}",
+                first_name="Test",
+                last_name="Patient",
+                gender="female",
+                birth_date=date(1980, 1, 1),
+                created_by=self.admin,
+            )
+            Appointment.objects.create(
+                patient=patient,
+                practitioner_reference="Practitioner/1",
+                start=start + timedelta(hours=index),
+                end=start + timedelta(hours=index, minutes=30),
+                confirmation_code=f"CONF{index}",
+            )
+
+    def test_patient_search_streams_bundle(self):
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/v1/patients/search/")
+            bundle = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(bundle["total"], 3)
+        self.assertEqual(len(bundle["entry"]), 3)
+        self.assertEqual(bundle["entry"][0]["resource"]["resource_id"], "patient-0")
+
+    def test_appointment_list_joins_patient(self):
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/v1/appointments/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_observation_list_newest_first(self):
+        patient = Patient.objects.get(resource_id="patient-0")
+        now = timezone.now()
+        for index in range(3):
+            Observation.objects.create(
+                patient=patient,
+                resource_id=f"obs-{index}",
+                status="final",
+                category="vital-signs",
+                code="8867-4",
+                effective_time=now - timedelta(hours=index),
+            )
+        response = self.client.get("/api/v1/observations/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["resource_id"] for item in response.data["results"]], ["obs-0", "obs-1", "obs-2"])
+
+    def test_hl7_message_list(self):
+        for index in range(3):
+            HL7Message.objects.create(message_id=f"msg-{index}", raw_message="MSH|test")
+        response = self.client.get("/api/v1/hl7-parser/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_fast_patient_serializer_matches_default(self):
+        patients = list(Patient.objects.all())
+        expected = [dict(item) for item in PatientSerializer(patients, many=True).data]
+        self.assertEqual(FastPatientSerializer(patients, many=True).data, expected)
+
+
+class AuditEventPayloadTests(APITestCase):
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser("root@test.com", password="pass12345")
+        self.client.force_authenticate(self.admin)
+        self.event_data = {
+            "event_type": "access",
+            "user_id": "user-1",
+            "resource_type": "Patient",
+            "resource_id": "patient-1",
+            "action": "read",
+            "timestamp": timezone.now().isoformat(),
+        }
+
+    def test_create_stores_metadata_in_payload(self):
+        response = self.client.post(
+            "/api/v1/audit/events/", {**self.event_data, "metadata": {"source": "portal"}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["metadata"], {"source": "portal"})
+        payload = AuditEventPayload.objects.get(event_id=response.data["id"])
+        self.assertEqual(payload.metadata, {"source": "portal"})
+
+    def test_list_renders_metadata(self):
+        event = AuditEvent.objects.create(**self.event_data)
+        AuditEventPayload.objects.create(event=event, metadata={"source": "portal"})
+        response = self.client.get("/api/v1/audit/events/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["metadata"], {"source": "portal"})
+
+    def test_event_without_payload_renders_empty_metadata(self):
+        event = AuditEvent.objects.create(**self.event_data)
+        response = self.client.get(f"/api/v1/audit/events/{event.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["metadata"], {})
+
+    def test_partial_update_writes_payload(self):
+        event = AuditEvent.objects.create(**self.event_data)
+        response = self.client.patch(
+            f"/api/v1/audit/events/{event.pk}/", {"metadata": {"reviewed": True}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["metadata"], {"reviewed": True})
+        self.assertEqual(AuditEventPayload.objects.get(event=event).metadata, {"reviewed": True})
+
+    def test_partial_update_without_metadata_keeps_payload(self):
+        event = AuditEvent.objects.create(**self.event_data)
+        AuditEventPayload.objects.create(event=event, metadata={"source": "portal"})
+        response = self.client.patch(f"/api/v1/audit/events/{event.pk}/", {"action": "update"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["metadata"], {"source": "portal"})
+        self.assertEqual(AuditEventPayload.objects.get(event=event).metadata, {"source": "portal"})
+
+
+class RoleAssignmentTests(APITestCase):
+    url = "/api/admin/users/assign-role/"
+
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser("root@test.com", password="pass12345")
+        self.client.force_authenticate(self.admin)
+        self.user = User.objects.create_user("member@test.com", password="pass12345")
+        self.staff_role = Role.objects.create(name="STAFF")
+        self.viewer_role = Role.objects.create(name="VIEWER")
+
+    def test_reassigning_existing_role_updates_assignment(self):
+        assignment = UserRole.objects.create(user=self.user, role=self.staff_role, reason="initial")
+        response = self.client.post(
+            self.url, {"user_id": self.user.pk, "roles": ["staff"], "reason": "renewed"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["id"], assignment.pk)
+        self.assertEqual(response.data[0]["role"]["name"], "STAFF")
+        assignment.refresh_from_db()
+        self.assertEqual(assignment.reason, "renewed")
+        self.assertEqual(assignment.assigned_by, self.admin)
+        self.assertEqual(UserRole.objects.filter(user=self.user).count(), 1)
+
+    def test_assigns_new_role_alongside_existing(self):
+        UserRole.objects.create(user=self.user, role=self.staff_role)
+        response = self.client.post(
+            self.url, {"user_id": self.user.pk, "roles": ["STAFF", "VIEWER"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([item["role"]["name"] for item in response.data], ["STAFF", "VIEWER"])
+        self.assertEqual(
+            sorted(UserRole.objects.filter(user=self.user).values_list("role__name", flat=True)),
+            ["STAFF", "VIEWER"],
+        )
+
+    def test_duplicate_role_names_create_one_assignment(self):
+        response = self.client.post(
+            self.url, {"user_id": self.user.pk, "roles": ["viewer", "VIEWER", "Viewer"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(UserRole.objects.filter(user=self.user, role=self.viewer_role).count(), 1)
+
+    def test_unknown_role_rejected(self):
+        response = self.client.post(self.url, {"user_id": self.user.pk, "roles": ["NURSE"]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(UserRole.objects.filter(user=self.user).exists())
+
+
+class HL7BatchTests(APITestCase):
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser("root@test.com", password="pass12345")
+        self.client.force_authenticate(self.admin)
+
+    def test_batch_skips_duplicate_message_ids(self):
+        response = self.client.post(
+            "/api/v1/hl7-parser/batch/",
+            {
+                "batch_id": "B1",
+                "messages": [
+                    {"message_id": "msg-1", "raw_message": "MSH|first"},
+                    {"message_id": "msg-1", "raw_message": "MSH|duplicate"},
+                    {"raw_message": "MSH|generated"},
+                ],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["total_messages"], 3)
+        self.assertEqual(response.data["processed"], 2)
+        self.assertEqual(response.data["failed"], 1)
+        stored = dict(HL7Message.objects.filter(batch__batch_id="B1").values_list("message_id", "raw_message"))
+        self.assertEqual(stored, {"msg-1": "MSH|first", "B1-3": "MSH|generated"})
+
+    def test_batch_with_max_length_id_keeps_every_message(self):
+        batch_id = "B" * 64
+        response = self.client.post(
+            "/api/v1/hl7-parser/batch/",
+            {"batch_id": batch_id, "messages": [{"raw_message": f"MSH|{index}"} for index in range(12)]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["processed"], 12)
+        self.assertEqual(response.data["failed"], 0)
+        message_ids = list(HL7Message.objects.filter(batch__batch_id=batch_id).values_list("message_id", flat=True))
+        self.assertEqual(len(set(message_ids)), 12)
+        self.assertTrue(all(len(message_id) <= 64 for message_id in message_ids))
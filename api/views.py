@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
+from django.db import transaction
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import permissions, status, viewsets
@@ -12,7 +14,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from . import filters
+from . import filters, rbac_cache
 from .models import (
     Appointment,
     AuditAnomaly,
@@ -67,8 +69,11 @@ from .serializers import (
     WaitlistEntrySerializer,
     RoleSerializer,
 )
+from .fast_serializers import FastNotificationSerializer, FastObservationSerializer, FastPatientSerializer
+from .pagination import CursorResultsPagination, EffectiveTimeCursorPagination
 from .permissions import ActionPermissionMixin, IsAdmin
-from .rbac import ROLE_PERMISSIONS
+from .renderers import orjson_dumps
+from .rbac import ROLE_PERMISSIONS, clear_user_memo, invalidate_user_roles
 
 
 class UserRegistrationView(APIView):
@@ -83,11 +88,38 @@ class UserRegistrationView(APIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class RoleProtectedModelViewSet(ActionPermissionMixin, viewsets.ModelViewSet):
+class RelatedQuerysetMixin:
+    """Join the model's ``DEFAULT_SELECT_RELATED`` foreign keys into the queryset."""
+
+    def get_queryset(self):  # type: ignore[override]
+        queryset = super().get_queryset()  # type: ignore[misc]
+        related = getattr(queryset.model, "DEFAULT_SELECT_RELATED", ())
+        if related:
+            queryset = queryset.select_related(*related)
+            # Joined rows only feed RBAC checks, so leave the related model's bulky columns behind.
+            deferred = [
+                f"{name}__{column}"
+                for name in related
+                for column in getattr(queryset.model._meta.get_field(name).related_model, "LIST_DEFER", ())
+            ]
+            if deferred:
+                queryset = queryset.defer(*deferred)
+        return queryset
+
+
+class RoleProtectedModelViewSet(ActionPermissionMixin, RelatedQuerysetMixin, viewsets.ModelViewSet):
     """Base viewset that wires RBAC to DRF actions."""
 
     permission_classes = [permissions.IsAuthenticated]
     filterset_class = None
+    # Optional read-only serializer used for the actions in ``read_actions``.
+    read_serializer_class = None
+    read_actions = frozenset({"list"})
+
+    def get_serializer_class(self):
+        if self.read_serializer_class is not None and self.action in self.read_actions:
+            return self.read_serializer_class
+        return super().get_serializer_class()
 
     def perform_create(self, serializer):
         model_class = getattr(serializer.Meta, "model", None)
@@ -119,30 +151,62 @@ class RoleManagementView(APIView):
         serializer = UserRoleAssignSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data["user"]
-        roles = serializer.validated_data["roles"]
+        role_ids = list(serializer.validated_data["roles"].values())
         effective_date = serializer.validated_data["effective_date"]
         expiry_date = serializer.validated_data.get("expiry_date")
         reason = serializer.validated_data.get("reason", "")
-        assignments: List[UserRole] = []
-        for role_name in roles:
-            role = get_object_or_404(Role, name__iexact=role_name)
-            assignment, _ = UserRole.objects.update_or_create(
-                user=user,
-                role=role,
-                defaults={
-                    "assigned_by": request.user,
-                    "reason": reason,
-                    "effective_date": effective_date,
-                    "expiry_date": expiry_date,
-                },
+
+        now = timezone.now()
+        with transaction.atomic():
+            existing: Dict[int, UserRole] = {}
+            for assignment in UserRole.objects.select_for_update().filter(user=user, role_id__in=role_ids):
+                existing.setdefault(assignment.role_id, assignment)
+            for assignment in existing.values():
+                assignment.assigned_by = request.user
+                assignment.reason = reason
+                assignment.effective_date = effective_date
+                assignment.expiry_date = expiry_date
+                assignment.updated_at = now
+            UserRole.objects.bulk_update(
+                existing.values(),
+                ["assigned_by", "reason", "effective_date", "expiry_date", "updated_at"],
             )
-            assignments.append(assignment)
+            UserRole.objects.bulk_create(
+                [
+                    UserRole(
+                        user=user,
+                        role_id=role_id,
+                        assigned_by=request.user,
+                        reason=reason,
+                        effective_date=effective_date,
+                        expiry_date=expiry_date,
+                    )
+                    for role_id in role_ids
+                    if role_id not in existing
+                ],
+                ignore_conflicts=True,
+            )
+        # Bulk writes skip the UserRole signals, so drop the user's cached RBAC data here.
+        invalidate_user_roles(user.pk)
+        rbac_cache.invalidate_user(user.pk)
+        clear_user_memo(user)
+
+        by_role = {
+            assignment.role_id: assignment
+            for assignment in UserRole.objects.select_related("role").filter(
+                user=user, role_id__in=role_ids, effective_date=effective_date
+            )
+        }
+        assignments = [by_role[role_id] for role_id in role_ids if role_id in by_role]
         return Response(UserRoleSerializer(assignments, many=True).data, status=status.HTTP_201_CREATED)
 
 
 class HL7MessageViewSet(RoleProtectedModelViewSet):
     queryset = HL7Message.objects.all().order_by("-created_at")
     serializer_class = HL7MessageSerializer
+    pagination_class = CursorResultsPagination
+    # DRF < 3.15 cursor pagination takes its ordering from OrderingFilter, which needs a default.
+    ordering = "-created_at"
     filterset_class = filters.HL7MessageFilter
     action_permission_map = {
         "list": ("hl7", "read"),
@@ -156,10 +220,11 @@ class HL7MessageViewSet(RoleProtectedModelViewSet):
         payload = request.data.copy() if hasattr(request.data, "copy") else request.data
         if not isinstance(payload, dict):
             payload = {"raw_message": payload}
-        payload.setdefault("message_id", payload.get("messageId") or f"msg-{timezone.now().timestamp()}")
+        now = timezone.now()
+        payload.setdefault("message_id", payload.get("messageId") or f"msg-{now.timestamp()}")
         serializer = self.get_serializer(data=payload)
         serializer.is_valid(raise_exception=True)
-        message = serializer.save(status="processed", processed_at=timezone.now())
+        message = serializer.save(status="processed", processed_at=now)
         response = {
             "messageId": message.message_id,
             "correlationId": message.correlation_id,
@@ -170,8 +235,9 @@ class HL7MessageViewSet(RoleProtectedModelViewSet):
         return Response(response, status=status.HTTP_201_CREATED)
 
     @action(detail=False, methods=["get"], url_path="parse-status/(?P<message_id>[^/]+)")
-    def parse_status(self, request: Request, message_id: str) -> Response:
-        message = get_object_or_404(self.get_queryset(), message_id=message_id)
+    def parse_status(self, request: Request, message_id: str) -> HttpResponse:
+        queryset = self.get_queryset().only("message_id", "status", "processed_at", "parsed_payload", "errors")
+        message = get_object_or_404(queryset, message_id=message_id)
         payload = {
             "messageId": message.message_id,
             "status": message.status,
@@ -179,7 +245,8 @@ class HL7MessageViewSet(RoleProtectedModelViewSet):
             "resourcesCreated": len(message.parsed_payload.get("fhirResources", [])),
             "errors": message.errors,
         }
-        return Response(payload)
+        # Fixed-shape status poll: encode directly rather than through content negotiation.
+        return HttpResponse(orjson_dumps(payload), content_type="application/json")
 
     @action(detail=False, methods=["post"], url_path="batch")
     def batch(self, request: Request) -> Response:
@@ -192,6 +259,8 @@ class HL7MessageViewSet(RoleProtectedModelViewSet):
 class PatientViewSet(RoleProtectedModelViewSet):
     queryset = Patient.objects.all()
     serializer_class = PatientSerializer
+    read_serializer_class = FastPatientSerializer
+    read_actions = frozenset({"list", "search"})
     filterset_class = filters.PatientFilter
     action_permission_map = {
         "list": ("patients", "read"),
@@ -209,39 +278,52 @@ class PatientViewSet(RoleProtectedModelViewSet):
         serializer.save(created_by=self.request.user)
 
     @action(detail=False, methods=["get"], url_path="search")
-    def search(self, request: Request) -> Response:
+    def search(self, request: Request) -> StreamingHttpResponse:
         queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        entries = [{"resource": item} for item in serializer.data]
-        return Response(
-            {
-                "resourceType": "Bundle",
-                "type": "searchset",
-                "total": len(entries),
-                "entry": entries,
-            }
-        )
+        total = queryset.count()
+        serializer = self.get_serializer()
+
+        def bundle() -> Iterator[bytes]:
+            # Emit the searchset Bundle entry by entry so large results are never held in memory.
+            yield b'{"resourceType":"Bundle","type":"searchset","total":%d,"entry":[' % total
+            separator = b""
+            for patient in queryset.iterator(chunk_size=200):
+                yield separator + orjson_dumps({"resource": serializer.to_representation(patient)})
+                separator = b","
+            yield b"]}"
+
+        return StreamingHttpResponse(bundle(), content_type="application/json")
 
     @action(detail=True, methods=["post"], url_path="merge/(?P<target_id>[^/.]+)")
     def merge(self, request: Request, pk: str, target_id: str) -> Response:
         source = self.get_object()
-        target = get_object_or_404(Patient, pk=target_id)
-        serializer = PatientMergeSerializer(data={
-            "source_patient": source.pk,
-            "target_patient": target.pk,
-            "reason": request.data.get("reason", "Duplicate records identified"),
-            "merge_strategy": request.data.get("mergeStrategy", "keep_latest"),
-            "fields": request.data.get("fields", []),
-            "audit_reason": request.data.get("auditReason", ""),
-            "merged_fields": request.data.get("mergedFields", []),
-            "audit_id": request.data.get("auditId", ""),
-            "performed_by": request.user.pk if request.user.is_authenticated else None,
-        })
-        serializer.is_valid(raise_exception=True)
-        merge = serializer.save()
+        with transaction.atomic():
+            # Lock both rows in pk order so concurrent merges of the same pair serialise without deadlocking.
+            locked = dict(
+                Patient.objects.select_for_update()
+                .filter(pk__in=(source.pk, target_id))
+                .order_by("pk")
+                .values_list("pk", "resource_id")
+            )
+            target_resource_id = locked.get(int(target_id))
+            if target_resource_id is None:
+                raise Http404
+            serializer = PatientMergeSerializer(data={
+                "source_patient": source.pk,
+                "target_patient": target_id,
+                "reason": request.data.get("reason", "Duplicate records identified"),
+                "merge_strategy": request.data.get("mergeStrategy", "keep_latest"),
+                "fields": request.data.get("fields", []),
+                "audit_reason": request.data.get("auditReason", ""),
+                "merged_fields": request.data.get("mergedFields", []),
+                "audit_id": request.data.get("auditId", ""),
+                "performed_by": request.user.pk if request.user.is_authenticated else None,
+            })
+            serializer.is_valid(raise_exception=True)
+            merge = serializer.save()
         payload = {
             "status": "merged",
-            "resultPatientId": target.resource_id,
+            "resultPatientId": target_resource_id,
             "mergedFields": merge.merged_fields,
             "auditId": merge.audit_id,
         }
@@ -275,8 +357,11 @@ class PatientViewSet(RoleProtectedModelViewSet):
 
 
 class ObservationViewSet(RoleProtectedModelViewSet):
-    queryset = Observation.objects.select_related("patient")
+    queryset = Observation.objects.all()
     serializer_class = ObservationSerializer
+    read_serializer_class = FastObservationSerializer
+    pagination_class = EffectiveTimeCursorPagination
+    ordering = "-effective_time"
     filterset_class = filters.ObservationFilter
     action_permission_map = {
         "list": ("observations", "read"),
@@ -299,28 +384,37 @@ class ObservationViewSet(RoleProtectedModelViewSet):
         lookback = 30
         if period.startswith("P") and period.endswith("D"):
             lookback = int(period[1:-1])
-        start_time = timezone.now() - timedelta(days=lookback)
-        queryset = queryset.filter(effective_time__gte=start_time)
+        now = timezone.now()
+        start_time = now - timedelta(days=lookback)
+        # Only three columns are needed, so skip model instances and the patient join.
+        rows = queryset.filter(effective_time__gte=start_time).values_list(
+            "effective_time", "status", "value_quantity"
+        )
         data_points = []
         values: List[float] = []
-        for obs in queryset:
-            value = obs.value_quantity.get("value") if isinstance(obs.value_quantity, dict) else None
+        unit = None
+        for effective_time, obs_status, value_quantity in rows:
+            if not isinstance(value_quantity, dict):
+                value_quantity = {}
+            if not data_points:
+                unit = value_quantity.get("unit")
+            value = value_quantity.get("value")
             if value is not None:
                 values.append(value)
             data_points.append(
                 {
-                    "timestamp": obs.effective_time,
+                    "timestamp": effective_time,
                     "value": value,
-                    "status": obs.status,
+                    "status": obs_status,
                 }
             )
         payload = {
             "patientId": patient_id,
             "observationType": code,
-            "unit": queryset.first().value_quantity.get("unit") if queryset else None,
+            "unit": unit,
             "timeRange": {
                 "start": start_time,
-                "end": timezone.now(),
+                "end": now,
             },
             "dataPoints": data_points,
             "referenceRanges": {
@@ -339,9 +433,11 @@ class ObservationViewSet(RoleProtectedModelViewSet):
 
 
 class AppointmentViewSet(RoleProtectedModelViewSet):
-    queryset = Appointment.objects.select_related("patient")
+    queryset = Appointment.objects.all()
     serializer_class = AppointmentSerializer
     filterset_class = filters.AppointmentFilter
+    # (hour, minute, slot type) of the daily availability slots.
+    SLOT_OFFSETS: Tuple[Tuple[int, int, str], ...] = ((9, 0, "available"), (10, 0, "tentative"))
     action_permission_map = {
         "list": ("appointments", "read"),
         "retrieve": ("appointments", "read"),
@@ -366,18 +462,11 @@ class AppointmentViewSet(RoleProtectedModelViewSet):
                 date = parsed
         else:
             date = timezone.now()
-        slots = [
-            {
-                "start": date.replace(hour=9, minute=0, second=0, microsecond=0),
-                "end": date.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(minutes=duration),
-                "type": "available",
-            },
-            {
-                "start": date.replace(hour=10, minute=0, second=0, microsecond=0),
-                "end": date.replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(minutes=duration),
-                "type": "tentative",
-            },
-        ]
+        length = timedelta(minutes=duration)
+        slots = []
+        for hour, minute, slot_type in self.SLOT_OFFSETS:
+            start = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            slots.append({"start": start, "end": start + length, "type": slot_type})
         payload = {
             "date": date.date(),
             "practitioner": practitioner,
@@ -389,10 +478,11 @@ class AppointmentViewSet(RoleProtectedModelViewSet):
     def waitlist(self, request: Request, pk: str) -> Response:
         appointment = self.get_object()
         patient_identifier = request.data.get("patientId")
-        patient_obj = get_object_or_404(Patient, resource_id=patient_identifier)
+        if not Patient.objects.filter(resource_id=patient_identifier).exists():
+            raise Http404
         serializer = WaitlistEntrySerializer(data={
             "appointment": appointment.pk,
-            "patient": patient_obj.pk,
+            "patient": patient_identifier,
             "preferred_dates": request.data.get("preferredDates", []),
             "preferred_times": request.data.get("preferredTimes", []),
             "priority": request.data.get("priority", "routine"),
@@ -453,8 +543,9 @@ class NotificationTemplateViewSet(RoleProtectedModelViewSet):
 
 
 class NotificationViewSet(RoleProtectedModelViewSet):
-    queryset = Notification.objects.select_related("template")
+    queryset = Notification.objects.all()
     serializer_class = NotificationSerializer
+    read_serializer_class = FastNotificationSerializer
     filterset_class = filters.NotificationFilter
     action_permission_map = {
         "list": ("notifications", "read"),
@@ -474,7 +565,7 @@ class NotificationCampaignViewSet(RoleProtectedModelViewSet):
 
 
 class RiskScoreViewSet(RoleProtectedModelViewSet):
-    queryset = RiskScore.objects.select_related("patient")
+    queryset = RiskScore.objects.all()
     serializer_class = RiskScoreSerializer
     filterset_class = filters.RiskScoreFilter
     action_permission_map = {
@@ -505,7 +596,7 @@ class MLModelVersionViewSet(RoleProtectedModelViewSet):
 
 
 class PersonalizedAlertViewSet(RoleProtectedModelViewSet):
-    queryset = PersonalizedAlert.objects.select_related("patient", "model")
+    queryset = PersonalizedAlert.objects.all()
     serializer_class = PersonalizedAlertSerializer
     action_permission_map = {
         "list": ("analytics", "read"),
@@ -517,6 +608,8 @@ class PersonalizedAlertViewSet(RoleProtectedModelViewSet):
 class AuditEventViewSet(RoleProtectedModelViewSet):
     queryset = AuditEvent.objects.all()
     serializer_class = AuditEventSerializer
+    pagination_class = CursorResultsPagination
+    ordering = "-created_at"
     action_permission_map = {
         "list": ("audit", "read"),
         "retrieve": ("audit", "read"),
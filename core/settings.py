@@ -118,6 +118,15 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
         "rest_framework.filters.SearchFilter",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "api.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "api.pagination.StandardResultsSetPagination",
     "PAGE_SIZE": 25,
     "EXCEPTION_HANDLER": "api.exceptions.api_exception_handler",
@@ -132,6 +141,14 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Seconds a resolved role/permission payload is reused per access token.
+RBAC_CACHE_SECONDS = int(os.getenv("RBAC_CACHE_SECONDS", "5"))
+# Seconds a user's active role names are reused from Django's cache. No CACHES
+# backend is configured, so each worker has its own LocMemCache and role changes
+# only invalidate the worker that made them; raise this only once CACHES points
+# every worker at a shared backend (Redis, Memcached).
+RBAC_ROLE_CACHE_SECONDS = int(os.getenv("RBAC_ROLE_CACHE_SECONDS", "5"))
+
 CORS_ALLOWED_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ALLOWED_ORIGINS", "").split(",") if origin.strip()]
 CORS_ALLOW_ALL_ORIGINS = not CORS_ALLOWED_ORIGINS
 